@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# ====== CONFIGURATION ======
+MODULES = ["in_in", "quiz_app", "ms_weather", "ms_organize", "ms_calculator"]
+HEAVY_MODULES = {"reportlab", "rich", "requests", "tkinter"}  # Should only load inside main()
+RUNS = 5
+# ===========================
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import(module):
+    """
+    Import `module` in a fresh interpreter under `python -X importtime` and
+    return (cumulative microseconds for the module, set of top-level packages loaded).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=HERE, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        reason = lines[-1] if lines else f"exit code {result.returncode}"
+        raise RuntimeError(f"importing {module} failed: {reason}")
+
+    cumulative = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line.split("|")
+        name = name.strip()
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(cum)
+    if cumulative is None:
+        raise RuntimeError(f"{module} not found in -X importtime output "
+                           "(already imported at interpreter startup?)")
+    return cumulative, loaded
+
+
+def positive_int(value):
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of each script.")
+    parser.add_argument("-n", "--runs", type=positive_int, default=RUNS, help="fresh interpreters per module")
+    parser.add_argument("--budget", type=float, metavar="MS",
+                        help="fail if a module's median import time exceeds this")
+    parser.add_argument("-o", "--output", metavar="FILE",
+                        help="append results as JSON lines to track them over time")
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    failures = []
+    results = []
+    print(f"{'module':<15}{'median ms':>10}{'min ms':>10}  heavy imports")
+    for module in args.modules:
+        timings = []
+        heavy = set()
+        try:
+            for _ in range(args.runs):
+                cumulative, loaded = measure_import(module)
+                timings.append(cumulative / 1000)
+                heavy |= loaded & HEAVY_MODULES
+        except RuntimeError as e:
+            print(f"{module:<15}{'error':>10}")
+            failures.append(f"{module}: {e}")
+            continue
+        median = statistics.median(timings)
+        print(f"{module:<15}{median:>10.2f}{min(timings):>10.2f}  "
+              f"{', '.join(sorted(heavy)) or '-'}")
+        results.append({
+            "timestamp": time.time(),
+            "module": module,
+            "median_ms": round(median, 3),
+            "min_ms": round(min(timings), 3),
+            "heavy_imports": sorted(heavy),
+        })
+
+        if heavy:
+            failures.append(f"{module} loads {', '.join(sorted(heavy))} at import")
+        if args.budget is not None and median > args.budget:
+            failures.append(f"{module} took {median:.2f} ms (budget {args.budget:.2f} ms)")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r) + "\n" for r in results))
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,3 @@
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
 from datetime import datetime
 import os
 import re
@@ -53,6 +50,11 @@ def get_next_invoice_number():
 
 
 def create_invoice(filename, company, client, invoice_no, items, tax_rate=0.18):
+    # reportlab is only needed for rendering, so keep it off the import path
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    from reportlab.lib import colors
+
     c = canvas.Canvas(filename, pagesize=A4)
     width, height = A4
 
@@ -109,7 +111,7 @@ def create_invoice(filename, company, client, invoice_no, items, tax_rate=0.18):
     c.save()
 
 
-if __name__ == "__main__":
+def main():
     ensure_dir(BASE_PATH)
 
     company = input("Enter company name: ").strip()
@@ -138,4 +140,8 @@ if __name__ == "__main__":
     create_invoice(save_path, company, client, invoice_no, items, tax_rate)
     print(f"✅ Invoice saved to: {save_path}")
     print(f"🗂 Latest invoice number stored in: {COUNTER_FILE}")
-    print(f"📜 Full history logged in: {HISTORY_FILE}")
\ No newline at end of file
+    print(f"📜 Full history logged in: {HISTORY_FILE}")
+
+
+if __name__ == "__main__":
+    main()
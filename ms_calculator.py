@@ -1,11 +1,10 @@
-import tkinter as tk
-
-root = tk.Tk()
-root.title("Interactive Calculator")
-root.geometry("360x500")
-root.configure(bg="#f0f0f0")
-
-expr = tk.StringVar()
+# Widgets are created in main() so the logic can be imported without a display
+root = None
+expr = None
+display = None
+btn_clear = None
+theme_btn = None
+buttons = []
 
 # Current theme colors
 theme = {
@@ -50,11 +49,14 @@ def shake():
         root.update()
         root.after(30)
 
+def evaluate(expression):
+    return str(eval(expression))
+
 def on_click(key, btn=None):
     if btn: flash(btn)
     if key == "=":
         try:
-            expr.set(str(eval(expr.get())))
+            expr.set(evaluate(expr.get()))
         except:
             expr.set("Error")
             shake()
@@ -65,13 +67,8 @@ def on_click(key, btn=None):
     else:
         expr.set(expr.get() + key)
 
-# ---------------- UI ----------------
-display = tk.Entry(root, textvariable=expr, font=("Segoe UI", 24),
-                   bd=0, justify="right", bg=theme["display_bg"], fg=theme["display_fg"])
-display.pack(fill="x", padx=16, pady=(16, 8))
-
-buttons = []
 def make_button(text, row, col):
+    import tkinter as tk
     btn = tk.Button(root, text=text, font=("Segoe UI", 18),
                     bg=theme["btn_bg"], fg=theme["btn_fg"],
                     bd=0, relief="flat", activebackground="#d0d0d0",
@@ -81,29 +78,48 @@ def make_button(text, row, col):
     buttons.append(btn)
     return btn
 
-labels = [
-    ('7',0,0),('8',0,1),('9',0,2),('/',0,3),
-    ('4',1,0),('5',1,1),('6',1,2),('*',1,3),
-    ('1',2,0),('2',2,1),('3',2,2),('-',2,3),
-    ('0',3,0),('.',3,1),('=',3,2),('+',3,3),
-]
-for txt, r, c in labels:
-    make_button(txt, r, c)
-
-# Clear and backspace row
-btn_clear = tk.Button(root, text="C", font=("Segoe UI", 18),
-                      bg="#ff6666", fg="#ffffff", bd=0, relief="flat",
-                      activebackground="#ff4c4c",
-                      command=lambda: on_click("C"))
-btn_clear.place(relx=0, rely=0.84, relwidth=0.5, relheight=0.16)
-
-make_button("⌫", 4, 2)  # Backspace button position
-
-# Theme toggle button
-theme_btn = tk.Button(root, text=" Theme", font=("Segoe UI", 14),
-                      command=toggle_theme, bd=0, relief="flat",
-                      bg=theme["btn_bg"], fg=theme["btn_fg"])
-theme_btn.place(relx=0.5, rely=0.84, relwidth=0.5, relheight=0.16)
-
-apply_theme()
-root.mainloop()
\ No newline at end of file
+# ---------------- UI ----------------
+def main():
+    global root, expr, display, btn_clear, theme_btn
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.title("Interactive Calculator")
+    root.geometry("360x500")
+    root.configure(bg="#f0f0f0")
+
+    expr = tk.StringVar()
+
+    display = tk.Entry(root, textvariable=expr, font=("Segoe UI", 24),
+                       bd=0, justify="right", bg=theme["display_bg"], fg=theme["display_fg"])
+    display.pack(fill="x", padx=16, pady=(16, 8))
+
+    labels = [
+        ('7',0,0),('8',0,1),('9',0,2),('/',0,3),
+        ('4',1,0),('5',1,1),('6',1,2),('*',1,3),
+        ('1',2,0),('2',2,1),('3',2,2),('-',2,3),
+        ('0',3,0),('.',3,1),('=',3,2),('+',3,3),
+    ]
+    for txt, r, c in labels:
+        make_button(txt, r, c)
+
+    # Clear and backspace row
+    btn_clear = tk.Button(root, text="C", font=("Segoe UI", 18),
+                          bg="#ff6666", fg="#ffffff", bd=0, relief="flat",
+                          activebackground="#ff4c4c",
+                          command=lambda: on_click("C"))
+    btn_clear.place(relx=0, rely=0.84, relwidth=0.5, relheight=0.16)
+
+    make_button("⌫", 4, 2)  # Backspace button position
+
+    # Theme toggle button
+    theme_btn = tk.Button(root, text=" Theme", font=("Segoe UI", 14),
+                          command=toggle_theme, bd=0, relief="flat",
+                          bg=theme["btn_bg"], fg=theme["btn_fg"])
+    theme_btn.place(relx=0.5, rely=0.84, relwidth=0.5, relheight=0.16)
+
+    apply_theme()
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
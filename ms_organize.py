@@ -1,7 +1,12 @@
 import os
 import shutil
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+
+# Widgets are created in main() so the logic can be imported without a display
+root = None
+folder_path = None
+category_vars = {}
+progress_var = None
+preview_frame = None
 
 # CATEGORY MAPPING
 CATEGORIES = {
@@ -23,7 +28,7 @@ def preview_files(folder):
         preview_data[category] = matches
     return preview_data
 
-def organize(folder, selected_categories):
+def organize(folder, selected_categories, on_progress=None):
     total_files = sum(len(files) for cat, files in preview_files(folder).items() if cat in selected_categories)
     moved_count = 0
     for cat, extensions in CATEGORIES.items():
@@ -39,16 +44,22 @@ def organize(folder, selected_categories):
             ):
                 shutil.move(file_path, os.path.join(dest_folder, file))
                 moved_count += 1
-                progress_var.set(int((moved_count / total_files) * 100))
-                root.update_idletasks()
+                if on_progress:
+                    on_progress(int((moved_count / total_files) * 100))
+
+def show_progress(percent):
+    progress_var.set(percent)
+    root.update_idletasks()
 
 def browse_folder():
+    from tkinter import filedialog
     folder_selected = filedialog.askdirectory()
     if folder_selected:
         folder_path.set(folder_selected)
         update_preview()
 
 def update_preview():
+    import tkinter as tk
     folder = folder_path.get()
     if not os.path.exists(folder):
         return
@@ -62,6 +73,7 @@ def update_preview():
                        variable=var, bg="#F8F9FA", anchor="w", font=("Segoe UI", 10)).pack(fill="x", pady=2)
 
 def start_organizing():
+    from tkinter import messagebox
     folder = folder_path.get()
     if not os.path.exists(folder):
         messagebox.showerror("Error", "Folder does not exist.")
@@ -71,37 +83,44 @@ def start_organizing():
         messagebox.showwarning("No Selection", "Please select at least one category.")
         return
     if messagebox.askyesno("Confirm", f"Organize selected categories in:\n{folder}?"):
-        organize(folder, selected)
+        organize(folder, selected, show_progress)
         messagebox.showinfo("Done", "Organizing complete!")
         update_preview()
 
 # GUI Setup
-root = tk.Tk()
-root.title("File Organizer Pro")
-root.geometry("480x420")
-root.configure(bg="#F8F9FA")
+def main():
+    global root, folder_path, progress_var, preview_frame
+    import tkinter as tk
+    from tkinter import ttk
 
-folder_path = tk.StringVar()
-category_vars = {}
-progress_var = tk.IntVar()
+    root = tk.Tk()
+    root.title("File Organizer Pro")
+    root.geometry("480x420")
+    root.configure(bg="#F8F9FA")
+
+    folder_path = tk.StringVar()
+    progress_var = tk.IntVar()
+
+    # Folder selection
+    tk.Label(root, text="Folder to Organize", font=("Segoe UI", 11, "bold"), bg="#F8F9FA").pack(pady=6)
+    tk.Entry(root, textvariable=folder_path, width=42, font=("Segoe UI", 10), relief="solid", bd=1).pack()
+    tk.Button(root, text="Browse", command=browse_folder, bg="#0078D4", fg="white",
+              font=("Segoe UI", 10, "bold"), relief="flat").pack(pady=6)
 
-# Folder selection
-tk.Label(root, text="Folder to Organize", font=("Segoe UI", 11, "bold"), bg="#F8F9FA").pack(pady=6)
-tk.Entry(root, textvariable=folder_path, width=42, font=("Segoe UI", 10), relief="solid", bd=1).pack()
-tk.Button(root, text="Browse", command=browse_folder, bg="#0078D4", fg="white",
-          font=("Segoe UI", 10, "bold"), relief="flat").pack(pady=6)
+    # Preview section
+    preview_frame = tk.Frame(root, bg="#F8F9FA")
+    preview_frame.pack(fill="both", expand=True, pady=10)
 
-# Preview section
-preview_frame = tk.Frame(root, bg="#F8F9FA")
-preview_frame.pack(fill="both", expand=True, pady=10)
+    # Progress bar
+    progress_bar = ttk.Progressbar(root, variable=progress_var, maximum=100)
+    progress_bar.pack(fill="x", padx=10, pady=8)
 
-# Progress bar
-progress_bar = ttk.Progressbar(root, variable=progress_var, maximum=100)
-progress_bar.pack(fill="x", padx=10, pady=8)
+    # Action button
+    tk.Button(root, text="Start Organizing", bg="#28A745", fg="white",
+              font=("Segoe UI", 11, "bold"), relief="flat",
+              command=start_organizing).pack(pady=10)
 
-# Action button
-tk.Button(root, text="Start Organizing", bg="#28A745", fg="white",
-          font=("Segoe UI", 11, "bold"), relief="flat",
-          command=start_organizing).pack(pady=10)
+    root.mainloop()
 
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 import os
-import tkinter as tk
-from tkinter import ttk
-import requests
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
 
 # --- Configuration ---
 API_KEY = os.getenv("OPENWEATHER_API_KEY", "Enter_API_Key")
@@ -11,9 +14,23 @@ CURRENT_URL  = "https://api.openweathermap.org/data/2.5/weather"
 FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"   # 5-day / 3-hour
 ONECALL_URL  = "https://api.openweathermap.org/data/3.0/onecall"     # Daily min/max (may require subscription)
 
-SESSION = requests.Session()
 TIMEOUT = 10  # seconds
 
+# requests and the Tk widgets are set up lazily so the logic imports quickly
+_session = None
+root = None
+city_var = None
+status_label = None
+cards = {}
+
+
+def get_session():
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
 
 def get_weather():
     city = city_var.get().strip()
@@ -26,33 +43,47 @@ def get_weather():
     root.after(50, lambda: fetch_and_render(city))
 
 
+def fetch_weather(city: str) -> dict:
+    """
+    Fetch current conditions and today's min/max for `city`. Raises
+    requests.HTTPError / requests.RequestException / KeyError / ValueError on failure.
+    """
+    # 1) Current conditions (for display + coords + timezone)
+    cur_params = {"q": city, "appid": API_KEY, "units": "metric"}
+    r = get_session().get(CURRENT_URL, params=cur_params, timeout=TIMEOUT)
+    handle_http_errors(r)
+    current = r.json()
+
+    lat       = current["coord"]["lat"]
+    lon       = current["coord"]["lon"]
+    tz_offset = current.get("timezone", 0)  # seconds offset from UTC
+
+    # 2) Daily min/max
+    tmin, tmax = get_today_minmax(lat, lon, city, tz_offset)
+
+    return {
+        "name":        current["name"],
+        "country":     current["sys"]["country"],
+        "description": current["weather"][0]["description"].title(),
+        "temp":        current["main"]["temp"],
+        "humidity":    current["main"]["humidity"],
+        "temp_min":    tmin,
+        "temp_max":    tmax,
+    }
+
+
 def fetch_and_render(city: str):
+    import requests
+
     try:
-        # 1) Current conditions (for display + coords + timezone)
-        cur_params = {"q": city, "appid": API_KEY, "units": "metric"}
-        r = SESSION.get(CURRENT_URL, params=cur_params, timeout=TIMEOUT)
-        handle_http_errors(r)
-        current = r.json()
-
-        weather   = current["weather"][0]["description"].title()
-        temp      = f"{round(current['main']['temp'], 1)} °C"
-        humidity  = f"{current['main']['humidity']} %"
-        name      = current["name"]
-        country   = current["sys"]["country"]
-        lat       = current["coord"]["lat"]
-        lon       = current["coord"]["lon"]
-        tz_offset = current.get("timezone", 0)  # seconds offset from UTC
-
-        # 2) Daily min/max
-        tmin, tmax = get_today_minmax(lat, lon, city, tz_offset)
-
-        # 3) Render UI
-        set_status(f"{name}, {country}", "#0d47a1")
-        update_card("Desc", weather)
-        update_card("Temp", temp)
-        update_card("Min", f"{round(tmin, 1)} °C")
-        update_card("Max", f"{round(tmax, 1)} °C")
-        update_card("Humidity", humidity)
+        w = fetch_weather(city)
+
+        set_status(f"{w['name']}, {w['country']}", "#0d47a1")
+        update_card("Desc", w["description"])
+        update_card("Temp", f"{round(w['temp'], 1)} °C")
+        update_card("Min", f"{round(w['temp_min'], 1)} °C")
+        update_card("Max", f"{round(w['temp_max'], 1)} °C")
+        update_card("Humidity", f"{w['humidity']} %")
 
     except requests.HTTPError as e:
         msg = friendly_http_error(e.response)
@@ -74,6 +105,8 @@ def get_today_minmax(lat: float, lon: float, city: str, tz_offset_sec: int):
     Try One Call (daily min/max). If unavailable (401/404/429/etc.), fall back to
     computing today's min/max from the 5-day/3-hour forecast.
     """
+    import requests
+
     # Attempt One Call 3.0
     try:
         oc_params = {
@@ -83,7 +116,7 @@ def get_today_minmax(lat: float, lon: float, city: str, tz_offset_sec: int):
             "units": "metric",
             "exclude": "minutely,hourly,alerts",
         }
-        r = SESSION.get(ONECALL_URL, params=oc_params, timeout=TIMEOUT)
+        r = get_session().get(ONECALL_URL, params=oc_params, timeout=TIMEOUT)
         if r.status_code == 200:
             data = r.json()
             daily = data.get("daily", [])
@@ -98,7 +131,7 @@ def get_today_minmax(lat: float, lon: float, city: str, tz_offset_sec: int):
 
     # Fall back: 5-day/3-hour forecast
     fc_params = {"q": city, "appid": API_KEY, "units": "metric"}
-    r = SESSION.get(FORECAST_URL, params=fc_params, timeout=TIMEOUT)
+    r = get_session().get(FORECAST_URL, params=fc_params, timeout=TIMEOUT)
     handle_http_errors(r)
     forecast = r.json()
 
@@ -147,6 +180,8 @@ def get_today_minmax(lat: float, lon: float, city: str, tz_offset_sec: int):
 
 
 def handle_http_errors(resp: requests.Response):
+    import requests
+
     try:
         resp.raise_for_status()
     except requests.HTTPError as e:
@@ -197,79 +232,87 @@ def set_status(text, color):
 
 
 # --- UI ---
-root = tk.Tk()
-root.title("Manav Weather Forecast")
-root.geometry("420x400")
-root.resizable(False, False)
-root.configure(bg="#e3f2fd")
-
-style = ttk.Style(root)
-style.theme_use("clam")
-
-style.configure(
-    "Header.TLabel",
-    background="#2196f3",
-    foreground="white",
-    font=("Segoe UI", 16, "bold"),
-    padding=10,
-)
-style.configure("TFrame", background="#e3f2fd")
-style.configure("TEntry", font=("Segoe UI", 12), padding=5)
-style.configure(
-    "TButton",
-    font=("Segoe UI", 8, "bold"),
-    padding=6,
-)
-style.map("TButton", background=[("active", "#1565c0")])
-style.configure(
-    "Card.TLabelframe",
-    background="white",
-    borderwidth=1,
-    relief="solid",
-    padding=8,
-)
-style.configure(
-    "Card.TLabelframe.Label",
-    background="white",
-    font=("Segoe UI", 10, "bold"),
-    foreground="#1e88e5",
-)
-
-header = ttk.Label(root, text="Manav Weather Forecast", style="Header.TLabel")
-header.pack(fill=tk.X)
-
-search_frame = ttk.Frame(root, padding=10)
-search_frame.pack(fill=tk.X)
-
-city_var = tk.StringVar()
-lbl_city = ttk.Label(search_frame, text="Enter City:")
-lbl_city.grid(row=0, column=0, padx=(0, 5))
-city_entry = ttk.Entry(search_frame, textvariable=city_var, width=20)
-city_entry.grid(row=0, column=1)
-btn_search = ttk.Button(search_frame, text="Search", command=get_weather)
-btn_search.grid(row=0, column=2, padx=6)
-city_entry.bind("<Return>", lambda e: get_weather())
-
-status_label = ttk.Label(root, text="Type a city and click Search")
-status_label.pack(pady=(0, 10))
-
-cards_frame = ttk.Frame(root, padding=10)
-cards_frame.pack(fill=tk.BOTH, expand=True)
-
-fields = ["Desc", "Temp", "Min", "Max", "Humidity"]
-cards = {}
-for idx, name in enumerate(fields):
-    lf = ttk.Labelframe(cards_frame, text=name, style="Card.TLabelframe")
-    lbl = ttk.Label(lf, text="", font=("Segoe UI", 12))
-    lbl.pack(expand=True)
-    row, col = divmod(idx, 2)
-    lf.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
-    lf.grid_remove()
-    cards[name] = (lf, lbl)
-
-for i in range(3):
-    cards_frame.rowconfigure(i, weight=1)
-for j in range(2):
-    cards_frame.columnconfigure(j, weight=1)
-
-root.mainloop()
+def main():
+    global root, city_var, status_label
+    import tkinter as tk
+    from tkinter import ttk
+
+    root = tk.Tk()
+    root.title("Manav Weather Forecast")
+    root.geometry("420x400")
+    root.resizable(False, False)
+    root.configure(bg="#e3f2fd")
+
+    style = ttk.Style(root)
+    style.theme_use("clam")
+
+    style.configure(
+        "Header.TLabel",
+        background="#2196f3",
+        foreground="white",
+        font=("Segoe UI", 16, "bold"),
+        padding=10,
+    )
+    style.configure("TFrame", background="#e3f2fd")
+    style.configure("TEntry", font=("Segoe UI", 12), padding=5)
+    style.configure(
+        "TButton",
+        font=("Segoe UI", 8, "bold"),
+        padding=6,
+    )
+    style.map("TButton", background=[("active", "#1565c0")])
+    style.configure(
+        "Card.TLabelframe",
+        background="white",
+        borderwidth=1,
+        relief="solid",
+        padding=8,
+    )
+    style.configure(
+        "Card.TLabelframe.Label",
+        background="white",
+        font=("Segoe UI", 10, "bold"),
+        foreground="#1e88e5",
+    )
+
+    header = ttk.Label(root, text="Manav Weather Forecast", style="Header.TLabel")
+    header.pack(fill=tk.X)
+
+    search_frame = ttk.Frame(root, padding=10)
+    search_frame.pack(fill=tk.X)
+
+    city_var = tk.StringVar()
+    lbl_city = ttk.Label(search_frame, text="Enter City:")
+    lbl_city.grid(row=0, column=0, padx=(0, 5))
+    city_entry = ttk.Entry(search_frame, textvariable=city_var, width=20)
+    city_entry.grid(row=0, column=1)
+    btn_search = ttk.Button(search_frame, text="Search", command=get_weather)
+    btn_search.grid(row=0, column=2, padx=6)
+    city_entry.bind("<Return>", lambda e: get_weather())
+
+    status_label = ttk.Label(root, text="Type a city and click Search")
+    status_label.pack(pady=(0, 10))
+
+    cards_frame = ttk.Frame(root, padding=10)
+    cards_frame.pack(fill=tk.BOTH, expand=True)
+
+    fields = ["Desc", "Temp", "Min", "Max", "Humidity"]
+    for idx, name in enumerate(fields):
+        lf = ttk.Labelframe(cards_frame, text=name, style="Card.TLabelframe")
+        lbl = ttk.Label(lf, text="", font=("Segoe UI", 12))
+        lbl.pack(expand=True)
+        row, col = divmod(idx, 2)
+        lf.grid(row=row, column=col, padx=8, pady=8, sticky="nsew")
+        lf.grid_remove()
+        cards[name] = (lf, lbl)
+
+    for i in range(3):
+        cards_frame.rowconfigure(i, weight=1)
+    for j in range(2):
+        cards_frame.columnconfigure(j, weight=1)
+
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
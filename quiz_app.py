@@ -1,26 +1,170 @@
 import json
+import os
 import random
 import time
-from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt
 
-console = Console()
+_console = None
+
+# ====== CONFIGURATION ======
+EVENTS_FILE = "quiz_events.jsonl"   # Append-only log of every answer
+STATS_FILE = "quiz_stats.json"      # Snapshot of per-question aggregates
+EVENT_BATCH_SIZE = 10               # Answers buffered before a flush
+# ===========================
+
 
 def load_questions(filename):
     with open(filename, "r", encoding="utf-8") as f:
         return json.load(f)
 
+
+def question_id(q):
+    # Stats are keyed by this value and JSON object keys are always strings
+    return str(q["id"]) if "id" in q else q["question"]
+
+
+def file_size(filename):
+    try:
+        return os.path.getsize(filename)
+    except FileNotFoundError:
+        return 0
+
+
+class EventLog:
+    """Buffers answer events in memory and appends them to a JSON-lines file in batches."""
+
+    def __init__(self, filename, batch_size=EVENT_BATCH_SIZE, on_flush=None):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.on_flush = on_flush
+        self.buffer = []
+
+    def append(self, event):
+        self.buffer.append(event)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        # A crash can leave a partial last line; start the batch on a fresh one
+        prefix = ""
+        if file_size(self.filename):
+            with open(self.filename, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    prefix = "\n"
+        with open(self.filename, "a", encoding="utf-8") as f:
+            f.write(prefix + "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in self.buffer))
+        self.buffer.clear()
+        if self.on_flush:
+            self.on_flush()
+
+    def close(self):
+        self.flush()
+
+
+class QuizStats:
+    """
+    Streaming per-question aggregates. Each answer updates the running counts
+    and mean response time in O(1), so lookups never rescan the event log.
+    """
+
+    def __init__(self, data=None):
+        self.data = data or {}
+
+    @classmethod
+    def load(cls, filename, events_file):
+        """
+        Load the snapshot in `filename`. If it is missing, corrupt, or was saved
+        for a different size of `events_file` (e.g. a crash between writing
+        events and saving stats), rebuild the stats by replaying the event log.
+        """
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot["log_size"] == file_size(events_file):
+                return cls(snapshot["questions"])
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            pass
+        return cls.replay(events_file)
+
+    @classmethod
+    def replay(cls, events_file):
+        stats = cls()
+        try:
+            with open(events_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        stats.update(json.loads(line))
+                    except ValueError:
+                        continue  # Partially written line
+        except FileNotFoundError:
+            pass
+        return stats
+
+    def save(self, filename, events_file):
+        snapshot = {"log_size": file_size(events_file), "questions": self.data}
+        tmp = filename + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, filename)
+
+    def update(self, event):
+        s = self.data.setdefault(event["question_id"], {"attempts": 0, "correct": 0, "mean_time": 0.0})
+        s["attempts"] += 1
+        s["correct"] += int(event["correct"])
+        s["mean_time"] += (event["response_time"] - s["mean_time"]) / s["attempts"]
+
+    def accuracy(self, qid):
+        s = self.data.get(qid)
+        return s["correct"] / s["attempts"] if s else None
+
+    def mean_time(self, qid):
+        s = self.data.get(qid)
+        return s["mean_time"] if s else None
+
+    def difficulty(self, qid):
+        # Laplace-smoothed error rate: unseen questions start at 0.5
+        s = self.data.get(qid, {"attempts": 0, "correct": 0})
+        return (s["attempts"] - s["correct"] + 1) / (s["attempts"] + 2)
+
+
+def pick_next_question(remaining, stats):
+    # Favour questions players tend to get wrong, but keep some randomness
+    weights = [stats.difficulty(question_id(q)) for q in remaining]
+    return random.choices(remaining, weights=weights)[0]
+
+
+def get_console():
+    # rich is slow to import, so the console is created on first use
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
 def show_intro():
+    console = get_console()
     console.rule("[bold cyan]Welcome to the Interactive Quiz!")
     console.print("Test your knowledge and see how you score 🏆", style="yellow")
     time.sleep(1)
 
-def run_quiz(questions):
+
+def run_quiz(questions, stats=None, event_log=None):
+    from rich.table import Table
+    from rich.prompt import Prompt
+
+    console = get_console()
     score = 0
-    random.shuffle(questions)
+    stats = stats if stats is not None else QuizStats()
+    remaining = list(questions)
+
+    for idx in range(1, len(questions) + 1):
+        q = pick_next_question(remaining, stats)
+        remaining.remove(q)
+        qid = question_id(q)
 
-    for idx, q in enumerate(questions, start=1):
         console.rule(f"[bold green]Question {idx}")
         console.print(q["question"], style="bold magenta")
 
@@ -32,19 +176,46 @@ def run_quiz(questions):
             table.add_row(f"[cyan]{i}[/]. {option}")
         console.print(table)
 
+        start = time.monotonic()
         choice = Prompt.ask("Your answer", choices=[str(i) for i in range(1, len(options)+1)])
-        if options[int(choice)-1] == q["answer"]:
+        response_time = time.monotonic() - start
+
+        chosen = options[int(choice)-1]
+        correct = chosen == q["answer"]
+        if correct:
             console.print("✅ [bold green]Correct![/]", justify="center")
             score += 1
         else:
             console.print(f"❌ [bold red]Wrong![/] The correct answer was [yellow]{q['answer']}[/]", justify="center")
 
+        event = {
+            "timestamp": time.time(),
+            "question_id": qid,
+            "choice": chosen,
+            "correct": correct,
+            "response_time": round(response_time, 3),
+        }
+        stats.update(event)
+        if event_log:
+            event_log.append(event)
+
         time.sleep(0.8)
 
     console.rule("[bold blue]Quiz Complete!")
     console.print(f"🏅 Your final score: [bold]{score}[/] / {len(questions)}", style="bold yellow")
+    return score
 
-if __name__ == "__main__":
+
+def main():
     show_intro()
     questions = load_questions("quiz_questions.json")
-    run_quiz(questions)
\ No newline at end of file
+    stats = QuizStats.load(STATS_FILE, EVENTS_FILE)
+    event_log = EventLog(EVENTS_FILE, on_flush=lambda: stats.save(STATS_FILE, EVENTS_FILE))
+    try:
+        run_quiz(questions, stats, event_log)
+    finally:
+        event_log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+import pytest
+
+from ms_calculator import evaluate
+
+
+def test_evaluate():
+    assert evaluate("2+3*4") == "14"
+    assert evaluate("7/2") == "3.5"
+
+
+def test_evaluate_raises_on_bad_input():
+    with pytest.raises(ZeroDivisionError):
+        evaluate("1/0")
+    with pytest.raises(SyntaxError):
+        evaluate("2+")
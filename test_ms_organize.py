@@ -0,0 +1,25 @@
+from ms_organize import organize, preview_files
+
+
+def test_organize_moves_selected_categories_and_reports_progress(tmp_path):
+    for name in ("a.pdf", "b.txt", "c.jpg", "d.xyz"):
+        (tmp_path / name).write_text("x")
+
+    preview = preview_files(str(tmp_path))
+    assert sorted(preview["Documents"]) == ["a.pdf", "b.txt"]
+    assert preview["Others"] == ["d.xyz"]
+
+    progress = []
+    organize(str(tmp_path), ["Documents", "Others"], on_progress=progress.append)
+
+    assert sorted(p.name for p in (tmp_path / "Documents").iterdir()) == ["a.pdf", "b.txt"]
+    assert [p.name for p in (tmp_path / "Others").iterdir()] == ["d.xyz"]
+    assert (tmp_path / "c.jpg").exists()
+    assert not (tmp_path / "Images").exists()
+    assert progress == [33, 66, 100]
+
+
+def test_organize_without_progress_callback(tmp_path):
+    (tmp_path / "clip.mp4").write_text("x")
+    organize(str(tmp_path), ["Videos"])
+    assert (tmp_path / "Videos" / "clip.mp4").exists()
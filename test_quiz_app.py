@@ -0,0 +1,167 @@
+import json
+import random
+
+import pytest
+
+from quiz_app import EventLog, QuizStats, pick_next_question, question_id
+
+
+def make_event(qid, correct, response_time=1.0):
+    return {"timestamp": 0.0, "question_id": qid, "choice": "x",
+            "correct": correct, "response_time": response_time}
+
+
+def read_events(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_event_log_flushes_at_batch_size(tmp_path):
+    path = tmp_path / "events.jsonl"
+    flushes = []
+    log = EventLog(str(path), batch_size=3, on_flush=lambda: flushes.append(1))
+
+    log.append(make_event("a", True))
+    log.append(make_event("b", False))
+    assert not path.exists()
+    assert flushes == []
+
+    log.append(make_event("c", True))
+    assert [e["question_id"] for e in read_events(path)] == ["a", "b", "c"]
+    assert log.buffer == []
+    assert flushes == [1]
+
+
+def test_event_log_close_flushes_remainder(tmp_path):
+    path = tmp_path / "events.jsonl"
+    flushes = []
+    log = EventLog(str(path), batch_size=10, on_flush=lambda: flushes.append(1))
+
+    log.close()
+    assert not path.exists()
+    assert flushes == []
+
+    log.append(make_event("a", True))
+    log.close()
+    assert len(read_events(path)) == 1
+    assert flushes == [1]
+
+
+def test_update_keeps_running_counts_and_mean():
+    stats = QuizStats()
+    for t in (1.0, 2.0, 6.0):
+        stats.update(make_event("q", True, t))
+    stats.update(make_event("q", False, 3.0))
+
+    s = stats.data["q"]
+    assert s["attempts"] == 4
+    assert s["correct"] == 3
+    assert s["mean_time"] == pytest.approx(3.0)
+
+
+def test_accuracy_mean_time_and_difficulty():
+    stats = QuizStats()
+    assert stats.accuracy("q") is None
+    assert stats.mean_time("q") is None
+    assert stats.difficulty("q") == 0.5
+
+    stats.update(make_event("q", True, 2.0))
+    stats.update(make_event("q", False, 4.0))
+    assert stats.accuracy("q") == 0.5
+    assert stats.mean_time("q") == pytest.approx(3.0)
+    assert stats.difficulty("q") == pytest.approx(2 / 4)
+
+    stats.update(make_event("q", False, 3.0))
+    assert stats.difficulty("q") == pytest.approx(3 / 5)
+
+
+def test_question_id_is_always_a_string():
+    assert question_id({"id": 1, "question": "Q?"}) == "1"
+    assert question_id({"question": "Q?"}) == "Q?"
+
+
+def test_save_load_round_trip_with_numeric_ids(tmp_path):
+    stats_file = str(tmp_path / "stats.json")
+    events_file = str(tmp_path / "events.jsonl")
+    qid = question_id({"id": 1, "question": "Q?"})
+
+    stats = QuizStats()
+    log = EventLog(events_file, batch_size=1, on_flush=lambda: stats.save(stats_file, events_file))
+    for correct in (False, False, True):
+        event = make_event(qid, correct)
+        stats.update(event)
+        log.append(event)
+
+    loaded = QuizStats.load(stats_file, events_file)
+    assert loaded.data == stats.data
+    assert loaded.difficulty(qid) == pytest.approx(3 / 5)
+
+    loaded.update(make_event(qid, True))
+    loaded.save(stats_file, events_file)
+    with open(stats_file, "r", encoding="utf-8") as f:
+        assert list(json.load(f)["questions"]) == ["1"]
+
+
+def test_load_replays_log_when_snapshot_is_corrupt(tmp_path):
+    stats_file = tmp_path / "stats.json"
+    events_file = tmp_path / "events.jsonl"
+    log = EventLog(str(events_file), batch_size=10)
+    log.append(make_event("q", True, 2.0))
+    log.append(make_event("q", False, 4.0))
+    log.close()
+    with open(events_file, "a", encoding="utf-8") as f:
+        f.write('{"question_id": "q", "corr')  # Truncated by a crash
+    stats_file.write_text('{"log_size": 12, "questi', encoding="utf-8")
+
+    stats = QuizStats.load(str(stats_file), str(events_file))
+    assert stats.data["q"]["attempts"] == 2
+    assert stats.mean_time("q") == pytest.approx(3.0)
+
+    log.append(make_event("q", True, 6.0))
+    log.append(make_event("r", False, 1.0))
+    log.close()
+
+    stats = QuizStats.load(str(stats_file), str(events_file))
+    assert stats.data["q"]["attempts"] == 3
+    assert stats.data["r"]["attempts"] == 1
+    assert stats.mean_time("q") == pytest.approx(4.0)
+
+
+def test_load_replays_log_when_snapshot_is_behind(tmp_path):
+    stats_file = str(tmp_path / "stats.json")
+    events_file = str(tmp_path / "events.jsonl")
+    stats = QuizStats()
+    log = EventLog(events_file, batch_size=1)
+
+    first = make_event("q", True)
+    stats.update(first)
+    log.append(first)
+    stats.save(stats_file, events_file)
+    log.append(make_event("q", False))  # Events written, stats never saved
+
+    loaded = QuizStats.load(stats_file, events_file)
+    assert loaded.data["q"]["attempts"] == 2
+
+
+def test_load_without_any_files_is_empty(tmp_path):
+    stats = QuizStats.load(str(tmp_path / "stats.json"), str(tmp_path / "events.jsonl"))
+    assert stats.data == {}
+
+
+def test_pick_next_question_weights_by_difficulty(monkeypatch):
+    easy = {"question": "easy"}
+    hard = {"question": "hard"}
+    stats = QuizStats()
+    for _ in range(8):
+        stats.update(make_event("easy", True))
+        stats.update(make_event("hard", False))
+
+    seen = {}
+
+    def fake_choices(population, weights):
+        seen["weights"] = weights
+        return [population[0]]
+
+    monkeypatch.setattr(random, "choices", fake_choices)
+    assert pick_next_question([easy, hard], stats) is easy
+    assert seen["weights"] == [pytest.approx(1 / 10), pytest.approx(9 / 10)]
@@ -0,0 +1,18 @@
+import subprocess
+import sys
+
+from bench_startup import HEAVY_MODULES, HERE, MODULES
+
+
+def test_scripts_import_without_heavy_dependencies():
+    code = (
+        "import sys\n"
+        f"for name in {MODULES!r}:\n"
+        "    __import__(name)\n"
+        "print(','.join(sorted({m.split('.')[0] for m in sys.modules})))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=HERE,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    loaded = set(result.stdout.strip().split(","))
+    assert not loaded & HEAVY_MODULES